@@ -0,0 +1,30 @@
+import joblib
+from skl2onnx import convert_sklearn
+from skl2onnx.common.data_types import FloatTensorType
+from onnx_models import ONNX_MODELS
+
+# Export the site type and style classifiers for ONNX Runtime inference.
+# SklearnWebsiteGenerator picks the .onnx files up when onnxruntime is installed.
+# train_models.py exports them after every training run, this script converts
+# existing pickles
+PICKLES = {
+    'site_type': 'models/site_type_classifier.pkl',
+    'style': 'models/style_classifier.pkl'
+}
+
+def export_model(model, path):
+    """Convert a fitted classifier to ONNX and write it to path"""
+    # Plain probability matrix instead of a list of {label: prob} dicts
+    onnx_model = convert_sklearn(
+        model,
+        initial_types=[('X', FloatTensorType([None, model.n_features_in_]))],
+        options={id(model): {'zipmap': False}}
+    )
+    
+    with open(path, 'wb') as f:
+        f.write(onnx_model.SerializeToString())
+
+if __name__ == "__main__":
+    for name, path in PICKLES.items():
+        export_model(joblib.load(path), ONNX_MODELS[name])
+        print(f"✓ Exported {ONNX_MODELS[name]}")
@@ -1,180 +1,81 @@
+import gzip
 import json
-from simple_models import SimpleMLModels
+import os
+from functools import lru_cache
+from types import MappingProxyType
+from simple_models import SimpleMLModels, copy_dsl
 
-class MLWebsiteGenerator:
-    def __init__(self):
-        print("Loading trained ML models...")
-        self.ml_models = SimpleMLModels()
-        print("✓ Models loaded!\n")
-        
-        # Component library (same as before)
-        self.components = {
-            'navbar': self.generate_navbar,
-            'hero': self.generate_hero,
-            'features': self.generate_features,
-            'footer': self.generate_footer,
-            'pricing': self.generate_pricing,
-            'testimonials': self.generate_testimonials,
-            'contact': self.generate_contact
-        }
-    
-    def generate_from_description(self, description):
-        """Generate complete website from text description using ML"""
-        print(f"Description: {description}\n")
-        
-        # Use ML to generate DSL
-        dsl = self.ml_models.generate_complete_dsl(description)
-        
-        print("=== ML Classification ===")
-        print(f"Site Type: {dsl['site_type']}")
-        print(f"Style: {dsl['style']}")
-        print(f"Confidence: {dsl['confidence']:.2%}")
-        print(f"Sections: {[s['type'] for s in dsl['sections']]}\n")
-        
-        # Generate HTML from DSL
-        html = self.dsl_to_html(dsl, description)
-        
-        return {
-            'dsl': dsl,
-            'html': html
-        }
-    
-    def dsl_to_html(self, dsl, description):
-        """Convert DSL to HTML using component library"""
-        sections_html = []
-        
-        for section in dsl['sections']:
-            section_type = section['type']
-            variant = section['variant']
-            
-            if section_type in self.components:
-                # Generate section with variant
-                html = self.components[section_type](variant, dsl, description)
-                sections_html.append(html)
-        
-        # Get theme colors based on style
-        colors = self.get_colors_for_style(dsl['style'])
-        
-        # Complete HTML
-        return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Generated Website - {dsl['site_type']}</title>
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ font-family: system-ui, -apple-system, sans-serif; line-height: 1.6; }}
-        button {{ transition: transform 0.2s, box-shadow 0.2s; }}
-        button:hover {{ transform: translateY(-2px); box-shadow: 0 6px 20px rgba(0,0,0,0.3); }}
-    </style>
-</head>
-<body>
-{chr(10).join(sections_html)}
-</body>
-</html>"""
-    
-    def get_colors_for_style(self, style):
-        """Get color scheme based on detected style"""
-        color_schemes = {
-            'modern_gradient': {'primary': '#667eea', 'secondary': '#764ba2'},
-            'minimal_clean': {'primary': '#2d3748', 'secondary': '#4a5568'},
-            'bold_colorful': {'primary': '#f56565', 'secondary': '#ed8936'},
-            'dark_mode': {'primary': '#1a202c', 'secondary': '#2d3748'},
-            'glassmorphism': {'primary': '#667eea', 'secondary': '#764ba2'}
-        }
-        return color_schemes.get(style, {'primary': '#667eea', 'secondary': '#764ba2'})
-    
-    def generate_navbar(self, variant, dsl, description):
-        """Generate navbar with variant"""
-        colors = self.get_colors_for_style(dsl['style'])
-        
-        if variant == 'transparent':
-            bg = 'rgba(255,255,255,0.9)'
-            style_attr = 'backdrop-filter: blur(10px);'
-        else:
-            bg = '#fff'
-            style_attr = ''
-        
-        return f"""
-<nav style="background:{bg};padding:20px 40px;box-shadow:0 2px 10px rgba(0,0,0,0.1);display:flex;justify-content:space-between;align-items:center;{style_attr}">
-    <div style="font-size:1.5rem;font-weight:bold;color:{colors['primary']}">Brand</div>
+# Color scheme per style, shared read-only by every request
+_COLOR_SCHEMES = MappingProxyType({
+    style: MappingProxyType(colors) for style, colors in {
+        'modern_gradient': {'primary': '#667eea', 'secondary': '#764ba2'},
+        'minimal_clean': {'primary': '#2d3748', 'secondary': '#4a5568'},
+        'bold_colorful': {'primary': '#f56565', 'secondary': '#ed8936'},
+        'dark_mode': {'primary': '#1a202c', 'secondary': '#2d3748'},
+        'glassmorphism': {'primary': '#667eea', 'secondary': '#764ba2'}
+    }.items()
+})
+_DEFAULT_COLORS = _COLOR_SCHEMES['modern_gradient']
+
+def _compact_html(html):
+    """Strip newlines and indentation from an HTML block"""
+    return ''.join(line.strip() for line in html.splitlines())
+
+# HTML blocks compiled once as compact UTF-8 templates; renderers only
+# substitute the per-page values into them with bytes %-formatting
+_TEMPLATES = {k: _compact_html(v).encode('utf-8') for k, v in {
+    'navbar_transparent': """
+<nav style="background:rgba(255,255,255,0.9);padding:20px 40px;box-shadow:0 2px 10px rgba(0,0,0,0.1);display:flex;justify-content:space-between;align-items:center;backdrop-filter: blur(10px);">
+    <div style="font-size:1.5rem;font-weight:bold;color:%(primary)s">Brand</div>
     <div style="display:flex;gap:30px">
         <a href="#home" style="color:#333;text-decoration:none">Home</a>
         <a href="#features" style="color:#333;text-decoration:none">Features</a>
         <a href="#about" style="color:#333;text-decoration:none">About</a>
         <a href="#contact" style="color:#333;text-decoration:none">Contact</a>
     </div>
-</nav>"""
-    
-    def generate_hero(self, variant, dsl, description):
-        """Generate hero with variant"""
-        colors = self.get_colors_for_style(dsl['style'])
-        
-        # Extract title from description (first few words)
-        words = description.split()[:5]
-        title = ' '.join(words).title()
-        
-        if variant == 'split_screen_with_image':
-            return f"""
-<section style="display:flex;min-height:600px;align-items:center;padding:80px 40px;background:linear-gradient(135deg,{colors['primary']},{colors['secondary']})">
+</nav>""",
+    'navbar_solid': """
+<nav style="background:#fff;padding:20px 40px;box-shadow:0 2px 10px rgba(0,0,0,0.1);display:flex;justify-content:space-between;align-items:center;">
+    <div style="font-size:1.5rem;font-weight:bold;color:%(primary)s">Brand</div>
+    <div style="display:flex;gap:30px">
+        <a href="#home" style="color:#333;text-decoration:none">Home</a>
+        <a href="#features" style="color:#333;text-decoration:none">Features</a>
+        <a href="#about" style="color:#333;text-decoration:none">About</a>
+        <a href="#contact" style="color:#333;text-decoration:none">Contact</a>
+    </div>
+</nav>""",
+    'hero_split': """
+<section style="display:flex;min-height:600px;align-items:center;padding:80px 40px;background:linear-gradient(135deg,%(primary)s,%(secondary)s)">
     <div style="flex:1;color:#fff">
-        <h1 style="font-size:3rem;margin-bottom:20px">{title}</h1>
-        <p style="font-size:1.25rem;margin-bottom:30px">{description}</p>
-        <button style="background:#fff;color:{colors['primary']};padding:15px 40px;border:none;border-radius:50px;font-size:1.1rem;font-weight:600;cursor:pointer">Get Started</button>
+        <h1 style="font-size:3rem;margin-bottom:20px">%(title)s</h1>
+        <p style="font-size:1.25rem;margin-bottom:30px">%(description)s</p>
+        <button style="background:#fff;color:%(primary)s;padding:15px 40px;border:none;border-radius:50px;font-size:1.1rem;font-weight:600;cursor:pointer">Get Started</button>
     </div>
     <div style="flex:1;display:flex;justify-content:center">
         <div style="width:400px;height:400px;background:rgba(255,255,255,0.2);border-radius:20px;backdrop-filter:blur(10px)"></div>
     </div>
-</section>"""
-        
-        else:  # centered_cta or minimal_text
-            return f"""
-<section style="background:linear-gradient(135deg,{colors['primary']},{colors['secondary']});color:#fff;padding:100px 20px;text-align:center;min-height:600px;display:flex;flex-direction:column;justify-content:center">
-    <h1 style="font-size:3rem;margin-bottom:20px">{title}</h1>
-    <p style="font-size:1.25rem;margin-bottom:30px;max-width:600px;margin-left:auto;margin-right:auto">{description}</p>
+</section>""",
+    'hero_centered': """
+<section style="background:linear-gradient(135deg,%(primary)s,%(secondary)s);color:#fff;padding:100px 20px;text-align:center;min-height:600px;display:flex;flex-direction:column;justify-content:center">
+    <h1 style="font-size:3rem;margin-bottom:20px">%(title)s</h1>
+    <p style="font-size:1.25rem;margin-bottom:30px;max-width:600px;margin-left:auto;margin-right:auto">%(description)s</p>
     <div>
-        <button style="background:#fff;color:{colors['primary']};padding:15px 40px;border:none;border-radius:50px;font-size:1.1rem;font-weight:600;cursor:pointer">Get Started</button>
+        <button style="background:#fff;color:%(primary)s;padding:15px 40px;border:none;border-radius:50px;font-size:1.1rem;font-weight:600;cursor:pointer">Get Started</button>
     </div>
-</section>"""
-    
-    def generate_features(self, variant, dsl, description):
-        """Generate features section"""
-        colors = self.get_colors_for_style(dsl['style'])
-        
-        # Default features
-        features = [
-            {'icon': '⚡', 'title': 'Fast', 'desc': 'Lightning fast performance'},
-            {'icon': '🎨', 'title': 'Beautiful', 'desc': 'Stunning designs'},
-            {'icon': '📱', 'title': 'Responsive', 'desc': 'Works everywhere'}
-        ]
-        
-        if variant == 'grid_4col':
-            features.append({'icon': '🔒', 'title': 'Secure', 'desc': 'Bank-level security'})
-            grid_cols = 'repeat(4,1fr)'
-        else:
-            grid_cols = 'repeat(3,1fr)'
-        
-        features_html = ''.join([
-            f"""<div style="background:#fff;padding:30px;border-radius:10px;box-shadow:0 4px 15px rgba(0,0,0,0.1);text-align:center">
-                <div style="font-size:3rem;margin-bottom:15px">{f['icon']}</div>
-                <h3 style="font-size:1.5rem;margin-bottom:10px">{f['title']}</h3>
-                <p style="color:#718096">{f['desc']}</p>
-            </div>"""
-            for f in features
-        ])
-        
-        return f"""
+</section>""",
+        'feature_card': """<div style="background:#fff;padding:30px;border-radius:10px;box-shadow:0 4px 15px rgba(0,0,0,0.1);text-align:center">
+                <div style="font-size:3rem;margin-bottom:15px">%(icon)s</div>
+                <h3 style="font-size:1.5rem;margin-bottom:10px">%(title)s</h3>
+                <p style="color:#718096">%(desc)s</p>
+            </div>""",
+    'features': """
 <section style="padding:80px 20px;background:#f7fafc">
     <h2 style="text-align:center;font-size:2.5rem;margin-bottom:50px">Features</h2>
-    <div style="display:grid;grid-template-columns:{grid_cols};gap:30px;max-width:1200px;margin:0 auto">
-        {features_html}
+    <div style="display:grid;grid-template-columns:%(grid_cols)s;gap:30px;max-width:1200px;margin:0 auto">
+        %(features_html)s
     </div>
-</section>"""
-    
-    def generate_pricing(self, variant, dsl, description):
-        """Generate pricing section"""
-        return f"""
+</section>""",
+    'pricing': """
 <section style="padding:80px 20px;background:#fff">
     <h2 style="text-align:center;font-size:2.5rem;margin-bottom:50px">Pricing</h2>
     <div style="display:grid;grid-template-columns:repeat(3,1fr);gap:30px;max-width:1000px;margin:0 auto">
@@ -194,11 +95,8 @@ class MLWebsiteGenerator:
             <button style="background:#667eea;color:#fff;padding:12px 30px;border:none;border-radius:8px;cursor:pointer;width:100%">Choose Plan</button>
         </div>
     </div>
-</section>"""
-    
-    def generate_testimonials(self, variant, dsl, description):
-        """Generate testimonials section"""
-        return f"""
+</section>""",
+    'testimonials': """
 <section style="padding:80px 20px;background:#f7fafc">
     <h2 style="text-align:center;font-size:2.5rem;margin-bottom:50px">What People Say</h2>
     <div style="display:grid;grid-template-columns:repeat(2,1fr);gap:30px;max-width:1000px;margin:0 auto">
@@ -211,11 +109,8 @@ class MLWebsiteGenerator:
             <p style="font-weight:bold">- Satisfied Client</p>
         </div>
     </div>
-</section>"""
-    
-    def generate_contact(self, variant, dsl, description):
-        """Generate contact section"""
-        return f"""
+</section>""",
+    'contact': """
 <section style="padding:80px 20px;background:#fff">
     <h2 style="text-align:center;font-size:2.5rem;margin-bottom:50px">Get In Touch</h2>
     <div style="max-width:600px;margin:0 auto;display:flex;flex-direction:column;gap:20px">
@@ -224,12 +119,8 @@ class MLWebsiteGenerator:
         <textarea placeholder="Message" rows="5" style="padding:15px;border:2px solid #e2e8f0;border-radius:8px;font-size:1rem;resize:vertical"></textarea>
         <button onclick="alert('Message sent!')" style="background:#667eea;color:#fff;padding:15px;border:none;border-radius:8px;font-size:1.1rem;font-weight:600;cursor:pointer">Send Message</button>
     </div>
-</section>"""
-    
-    def generate_footer(self, variant, dsl, description):
-        """Generate footer"""
-        if variant == 'detailed':
-            return f"""
+</section>""",
+    'footer_detailed': """
 <footer style="background:#2d3748;color:#fff;padding:60px 40px">
     <div style="display:grid;grid-template-columns:repeat(3,1fr);gap:40px;max-width:1200px;margin:0 auto 40px">
         <div>
@@ -260,9 +151,8 @@ class MLWebsiteGenerator:
     <div style="text-align:center;padding-top:40px;border-top:1px solid #4a5568">
         <p>© 2024 Company. All rights reserved.</p>
     </div>
-</footer>"""
-        else:  # minimal
-            return f"""
+</footer>""",
+    'footer_minimal': """
 <footer style="background:#2d3748;color:#fff;padding:40px 20px;text-align:center">
     <p style="margin-bottom:10px">© 2024 Company. All rights reserved.</p>
     <div style="display:flex;gap:20px;justify-content:center;margin-top:20px">
@@ -271,19 +161,250 @@ class MLWebsiteGenerator:
         <a href="#" style="color:#a0aec0;text-decoration:none">Contact</a>
     </div>
 </footer>"""
+}.items()}
+
+def _navbar_transparent(ctx):
+    return _TEMPLATES['navbar_transparent'] % ctx
+
+def _navbar_solid(ctx):
+    return _TEMPLATES['navbar_solid'] % ctx
+
+def _hero_split(ctx):
+    return _TEMPLATES['hero_split'] % ctx
+
+def _hero_centered(ctx):
+    return _TEMPLATES['hero_centered'] % ctx
+
+def _features_grid(features, grid_cols):
+    """Render a features section from its cards"""
+    card = _TEMPLATES['feature_card']
+    cards = [card % {k.encode('utf-8'): v.encode('utf-8') for k, v in f.items()} for f in features]
+    return _TEMPLATES['features'] % {
+        b'grid_cols': grid_cols.encode('utf-8'),
+        b'features_html': b''.join(cards)
+    }
+
+# Default features, the 4 column grid adds a fourth card
+_FEATURES = [
+    {'icon': '⚡', 'title': 'Fast', 'desc': 'Lightning fast performance'},
+    {'icon': '🎨', 'title': 'Beautiful', 'desc': 'Stunning designs'},
+    {'icon': '📱', 'title': 'Responsive', 'desc': 'Works everywhere'}
+]
+
+# Feature sections do not depend on the page, so they are rendered once
+_FEATURES_3COL = _features_grid(_FEATURES, 'repeat(3,1fr)')
+_FEATURES_4COL = _features_grid(
+    _FEATURES + [{'icon': '🔒', 'title': 'Secure', 'desc': 'Bank-level security'}],
+    'repeat(4,1fr)'
+)
+
+def _features_3col(ctx):
+    return _FEATURES_3COL
+
+def _features_4col(ctx):
+    return _FEATURES_4COL
+
+def _pricing(ctx):
+    return _TEMPLATES['pricing']
+
+def _testimonials(ctx):
+    return _TEMPLATES['testimonials']
+
+def _contact(ctx):
+    return _TEMPLATES['contact']
+
+def _footer_detailed(ctx):
+    return _TEMPLATES['footer_detailed']
+
+def _footer_minimal(ctx):
+    return _TEMPLATES['footer_minimal']
+
+# (section_type, variant) -> renderer taking the page context
+_RENDERERS = {
+    ('navbar', 'transparent'): _navbar_transparent,
+    ('navbar', 'solid'): _navbar_solid,
+    ('hero', 'split_screen_with_image'): _hero_split,
+    ('hero', 'centered_cta'): _hero_centered,
+    ('hero', 'minimal_text'): _hero_centered,
+    ('features', 'grid_3col'): _features_3col,
+    ('features', 'grid_4col'): _features_4col,
+    ('footer', 'detailed'): _footer_detailed,
+    ('footer', 'minimal'): _footer_minimal
+}
+
+# Renderer per section type for variants not listed in _RENDERERS
+_DEFAULT_RENDERERS = {
+    'navbar': _navbar_solid,
+    'hero': _hero_centered,
+    'features': _features_3col,
+    'footer': _footer_minimal,
+    'pricing': _pricing,
+    'testimonials': _testimonials,
+    'contact': _contact
+}
+
+class MLWebsiteGenerator:
+    # Output directories already created by save_website
+    _made_dirs = set()
+    
+    # Page shell with %s marking where the site type and the sections go
+    _shell = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Generated Website - %s</title>
+    <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body { font-family: system-ui, -apple-system, sans-serif; line-height: 1.6; }
+        button { transition: transform 0.2s, box-shadow 0.2s; }
+        button:hover { transform: translateY(-2px); box-shadow: 0 6px 20px rgba(0,0,0,0.3); }
+    </style>
+</head>
+<body>
+%s
+</body>
+</html>"""
+    
+    # The shell as UTF-8 fragments around the two injection points
+    _shell_a, _shell_b, _shell_c = (part.encode('utf-8') for part in _shell.split('%s'))
+    
+    # Section renderers, see _RENDERERS and _DEFAULT_RENDERERS
+    _render = _RENDERERS
+    _default_for_section = _DEFAULT_RENDERERS
+    
+    def __init__(self):
+        print("Loading trained ML models...")
+        self.ml_models = SimpleMLModels()
+        print("✓ Models loaded!\n")
+        
+        # Repeat descriptions are served from here without re-running the models
+        self._generate_cached = lru_cache(maxsize=512)(self._generate_uncached)
+    
+    def generate_from_description(self, description):
+        """Generate complete website from text description using ML
+        
+        Repeat descriptions are served from a cache without printing the
+        classification again. Every call returns its own copy of the DSL
+        """
+        result = self._generate_cached(description)
+        return {'dsl': copy_dsl(result['dsl']), 'html': result['html']}
+    
+    def _generate_uncached(self, description):
+        """Run classification and rendering for one description"""
+        print(f"Description: {description}\n")
+        
+        # Use ML to generate DSL
+        dsl = self.ml_models.generate_complete_dsl(description)
+        
+        print("=== ML Classification ===")
+        print(f"Site Type: {dsl['site_type']}")
+        print(f"Style: {dsl['style']}")
+        print(f"Confidence: {dsl['confidence']:.2%}")
+        print(f"Sections: {[s['type'] for s in dsl['sections']]}\n")
+        
+        # Generate HTML from DSL
+        html = self.dsl_to_html(dsl, description)
+        
+        return {
+            'dsl': dsl,
+            'html': html
+        }
+    
+    def dsl_to_html(self, dsl, description):
+        """Convert DSL to UTF-8 encoded HTML using component library"""
+        return self.render_page(dsl, self.page_values(description))
+    
+    def page_values(self, description):
+        """Encoded description-derived values the templates substitute"""
+        # Extract title from description (first few words)
+        title = ' '.join(description.split()[:5]).title()
+        
+        return {
+            b'title': title.encode('utf-8'),
+            b'description': description.encode('utf-8')
+        }
+    
+    def compile_page(self, dsl):
+        """Specialize a DSL into one bytes %-template of title and description"""
+        # Render with markers in place of the page values, then turn the
+        # markers into the only placeholders left in the page
+        page = self.render_page(dsl, {b'title': b'\0title\0', b'description': b'\0description\0'})
+        
+        return (page.replace(b'%', b'%%')
+                    .replace(b'\0title\0', b'%(title)s')
+                    .replace(b'\0description\0', b'%(description)s'))
+    
+    def render_page(self, dsl, values):
+        """Render a DSL with the encoded values from page_values"""
+        # Resolve and encode everything the renderers need once per page
+        colors = self.get_colors_for_style(dsl['style'])
+        ctx = {
+            b'primary': colors['primary'].encode('utf-8'),
+            b'secondary': colors['secondary'].encode('utf-8'),
+            **values
+        }
+        
+        render = self._render
+        default_for_section = self._default_for_section
+        sections = dsl['sections']
+        sections_html = [b''] * len(sections)
+        
+        for i, section in enumerate(sections):
+            section_type = section['type']
+            renderer = render.get((section_type, section['variant'])) or default_for_section.get(section_type)
+            
+            if renderer is not None:
+                # Render section with variant
+                sections_html[i] = renderer(ctx)
+        
+        # Complete HTML, skipping unknown section types
+        body = b'\n'.join([html for html in sections_html if html])
+        return b''.join([
+            self._shell_a, dsl['site_type'].encode('utf-8'),
+            self._shell_b, body,
+            self._shell_c
+        ])
+    
+    def get_colors_for_style(self, style):
+        """Get color scheme based on detected style"""
+        return _COLOR_SCHEMES.get(style, _DEFAULT_COLORS)
     
     def save_website(self, html, filename='output/generated_website.html'):
-        """Save generated HTML"""
-        import os
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        """Save generated HTML (bytes or str), gzip-compressed if filename ends in .gz"""
+        directory = os.path.dirname(filename)
+        if directory not in self._made_dirs:
+            os.makedirs(directory or '.', exist_ok=True)
+            self._made_dirs.add(directory)
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(html)
+        data = html.encode('utf-8') if isinstance(html, str) else html
+        
+        if filename.endswith('.gz'):
+            with gzip.open(filename, 'wb', compresslevel=1) as f:
+                f.write(data)
+        else:
+            with open(filename, 'wb', buffering=1 << 20) as f:
+                f.write(data)
         
         print(f"✓ Website saved to {filename}")
 
+# Per-process generator for the __main__ worker pool, created by init_worker
+_worker_generator = None
+
+def init_worker():
+    """Load the models once per worker process"""
+    global _worker_generator
+    _worker_generator = MLWebsiteGenerator()
+
+def generate_test_website(job):
+    """Generate and save one test website in a worker process"""
+    i, desc = job
+    result = _worker_generator.generate_from_description(desc)
+    _worker_generator.save_website(result['html'], f'output/test_website_{i}.html')
+    return len(result['html'])
+
 if __name__ == "__main__":
-    generator = MLWebsiteGenerator()
+    from concurrent.futures import ProcessPoolExecutor
     
     # Test with different descriptions
     test_descriptions = [
@@ -292,14 +413,10 @@ if __name__ == "__main__":
         "ecommerce store for selling organic products with featured items"
     ]
     
-    for i, desc in enumerate(test_descriptions, 1):
-        print(f"\n{'='*60}")
-        print(f"Test {i}")
-        print('='*60)
-        
-        result = generator.generate_from_description(desc)
-        generator.save_website(result['html'], f'output/test_website_{i}.html')
-        
-        print(f"\nGenerated {len(result['html'])} characters of HTML")
+    with ProcessPoolExecutor(initializer=init_worker) as executor:
+        sizes = list(executor.map(generate_test_website, enumerate(test_descriptions, 1)))
+    
+    for i, size in enumerate(sizes, 1):
+        print(f"\nTest {i}: generated {size} bytes of HTML")
 
     print("\n✅ All test websites generated!")
\ No newline at end of file
@@ -1,102 +1,265 @@
 import pandas as pd
+import numpy as np
 import joblib
 import json
+import os
+import re
+import time
+from functools import cached_property, lru_cache
 from generator_with_ml import MLWebsiteGenerator
+from onnx_models import ONNX_MODELS
+
+try:
+    import onnxruntime as ort
+except ImportError:  # ONNX Runtime is optional, sklearn is used without it
+    ort = None
 
 class SklearnWebsiteGenerator(MLWebsiteGenerator):
-    def __init__(self):
-        print("Loading sklearn models...")
+    # Description keywords and the feature flag each one sets. The lookahead
+    # keeps substring semantics and also finds overlapping keywords
+    _KW_RE = re.compile(r'(?=(hero|landing|features|services|pricing|plans|testimonial|reviews|contact))')
+    _KW_TO_BIT = {
+        'hero': 0, 'landing': 0,
+        'features': 1, 'services': 1,
+        'pricing': 2, 'plans': 2,
+        'testimonial': 3, 'reviews': 3,
+        'contact': 4
+    }
+    
+    # Feature columns set by the keyword flags, in keyword_flags order
+    _FLAG_COLUMNS = [3, 4, 6, 7, 8]
+    
+    def __init__(self, warmup=False):
+        # sklearn models and layout templates are loaded lazily on first use,
+        # see the cached properties below
         
-        # Load sklearn models
-        self.site_type_model = joblib.load('models/site_type_classifier.pkl')
-        self.style_model = joblib.load('models/style_classifier.pkl')
-        self.component_selectors = joblib.load('models/component_selectors.pkl')
-        self.label_encoders = joblib.load('models/label_encoders.pkl')
+        # Repeat descriptions are served from here without re-running the models
+        self._generate_cached = lru_cache(maxsize=512)(self._generate_uncached)
         
+        # Optionally pay the load and first-prediction cost up front
+        if warmup:
+            self.warmup()
+    
+    @cached_property
+    def site_type_model(self):
+        """Site type classifier, loaded on first access"""
+        return joblib.load('models/site_type_classifier.pkl')
+    
+    @cached_property
+    def style_model(self):
+        """Style classifier, loaded on first access"""
+        return joblib.load('models/style_classifier.pkl')
+    
+    @cached_property
+    def component_selectors(self):
+        """Per-component variant selectors, loaded on first access"""
+        return joblib.load('models/component_selectors.pkl')
+    
+    @cached_property
+    def label_encoders(self):
+        """Label encoders for all model inputs and outputs, loaded on first access"""
+        return joblib.load('models/label_encoders.pkl')
+    
+    @cached_property
+    def _inv(self):
+        """Encoder classes per label, indexed by encoded value"""
+        return {k: le.classes_ for k, le in self.label_encoders.items()}
+    
+    @cached_property
+    def _fwd(self):
+        """Encoded value per label, replacing LabelEncoder.transform"""
+        return {
+            k: {c: i for i, c in enumerate(le.classes_)}
+            for k, le in self.label_encoders.items()
+        }
+    
+    @cached_property
+    def layout_templates(self):
+        """Most common layouts per site type, loaded on first access"""
         with open('models/layout_templates.json') as f:
-            self.layout_templates = json.load(f)
-        
-        print("✓ Models loaded!\n")
-        
-        # Component library
-        self.components = {
-            'navbar': self.generate_navbar,
-            'hero': self.generate_hero,
-            'features': self.generate_features,
-            'footer': self.generate_footer,
-            'pricing': self.generate_pricing,
-            'testimonials': self.generate_testimonials,
-            'contact': self.generate_contact
+            return json.load(f)
+    
+    def warmup(self):
+        """Load every model and run one dummy prediction to pay first-call costs"""
+        start = time.perf_counter()
+        
+        self.classify(np.zeros((1, 12), dtype=np.float32))
+        
+        for model in self.component_selectors.values():
+            model.predict(np.zeros((1, 5), dtype=np.float32))
+        
+        # Touch the cached property so the per-(site_type, style) skeletons
+        # and pages the request path reads are built now
+        _ = self._compiled_pages
+        
+        print(f"✓ Models warmed up in {time.perf_counter() - start:.2f}s")
+    
+    @cached_property
+    def _onnx_sessions(self):
+        """ONNX Runtime sessions for the classifiers, empty if unavailable"""
+        if ort is None or not all(os.path.exists(path) for path in ONNX_MODELS.values()):
+            return {}
+        
+        return {
+            name: ort.InferenceSession(path, providers=['CPUExecutionProvider'])
+            for name, path in ONNX_MODELS.items()
         }
     
-    def generate_from_description(self, description):
+    def classify(self, X):
+        """Encoded site types, encoded styles and site type confidences for X"""
+        sessions = self._onnx_sessions
+        
+        if sessions:
+            site_type_idx, site_type_proba = sessions['site_type'].run(None, {'X': X})
+            style_idx = sessions['style'].run(None, {'X': X})[0]
+            return site_type_idx, style_idx, site_type_proba.max(axis=1).astype(np.float64)
+        
+        site_type_idx = self.site_type_model.predict(X)
+        style_idx = self.style_model.predict(X)
+        site_type_proba = self.site_type_model.predict_proba(X).max(axis=1)
+        
+        return site_type_idx, style_idx, site_type_proba
+    
+    def _generate_uncached(self, description):
         """Generate website using sklearn models"""
-        print(f"Description: {description}\n")
+        return self.generate_batch([description])[0]
+    
+    def generate_batch(self, descriptions):
+        """Generate websites for several descriptions with batched sklearn calls"""
+        # Extract features for the whole batch
+        X = self.extract_features_batch(descriptions)
         
-        # Extract features from description
-        features = self.extract_features(description)
+        # Classify, one call per model for all descriptions
+        site_type_idx, style_idx, site_type_proba = self.classify(X)
         
-        # Classify using sklearn
-        site_type_idx = self.site_type_model.predict([features])[0]
-        style_idx = self.style_model.predict([features])[0]
+        site_types = self._inv['site_type'][site_type_idx]
+        styles = self._inv['style'][style_idx]
         
-        site_type = self.label_encoders['site_type'].inverse_transform([site_type_idx])[0]
-        style = self.label_encoders['style'].inverse_transform([style_idx])[0]
+        dsls = []
+        pending = []
+        for description, site_type, style, confidence in zip(descriptions, site_types, styles, site_type_proba):
+            print(f"Description: {description}\n")
+            print("=== ML Classification (sklearn) ===")
+            print(f"Site Type: {site_type} (confidence: {confidence:.2%})")
+            print(f"Style: {style}")
+            
+            dsl = self.build_dsl(site_type, style, confidence)
+            print(f"Sections: {[s['type'] for s in dsl['sections']]}\n")
+            
+            # Variants only depend on (site_type, style), reuse the skeleton
+            skeleton = self._skeleton_cache.get((site_type, style))
+            if skeleton is not None:
+                dsl['sections'] = [dict(section) for section in skeleton]
+            else:
+                pending.append(dsl)
+            
+            dsls.append(dsl)
         
-        # Get confidence
-        site_type_proba = self.site_type_model.predict_proba([features])[0].max()
+        self.select_variants_batch(pending)
         
-        print("=== ML Classification (sklearn) ===")
-        print(f"Site Type: {site_type} (confidence: {site_type_proba:.2%})")
-        print(f"Style: {style}")
+        # Generate HTML, pages with a compiled template only fill in the
+        # description-derived values
+        results = []
+        for dsl, description in zip(dsls, descriptions):
+            page = self._compiled_pages.get((dsl['site_type'], dsl['style']))
+            
+            if page is not None:
+                html = page % self.page_values(description)
+            else:
+                html = self.dsl_to_html(dsl, description)
+            
+            results.append({'dsl': dsl, 'html': html})
         
-        # Generate layout
+        return results
+    
+    def generate_layout(self, site_type):
+        """Generate layout sections for site type"""
         if site_type in self.layout_templates:
-            sections = self.layout_templates[site_type][0]
+            return self.layout_templates[site_type][0]
         else:
-            sections = ['navbar', 'hero', 'features', 'footer']
-        
-        print(f"Sections: {sections}\n")
-        
-        # Build DSL
-        dsl = {
+            return ['navbar', 'hero', 'features', 'footer']
+    
+    def build_dsl(self, site_type, style, confidence):
+        """Build a DSL whose section variants are still to be selected"""
+        return {
             'site_type': site_type,
             'style': style,
-            'confidence': site_type_proba,
-            'sections': []
+            'confidence': confidence,
+            'sections': [
+                {'type': section_type, 'position': i, 'variant': None}
+                for i, section_type in enumerate(self.generate_layout(site_type))
+            ]
         }
+    
+    @cached_property
+    def _skeleton_cache(self):
+        """Finished section lists for every (site_type, style) the models can emit"""
+        site_type_enc = self._fwd['component_site_type']
+        style_enc = self._fwd['component_style']
         
-        for i, section_type in enumerate(sections):
-            variant = self.select_variant_sklearn(site_type, style, section_type)
-            
-            dsl['sections'].append({
-                'type': section_type,
-                'position': i,
-                'variant': variant
-            })
+        dsls = [
+            self.build_dsl(site_type, style, None)
+            for site_type in self._inv['site_type']
+            for style in self._inv['style']
+            # Pairs the selectors cannot encode are resolved per request
+            if site_type in site_type_enc and style in style_enc
+        ]
+        self.select_variants_batch(dsls)
         
-        # Generate HTML
-        html = self.dsl_to_html(dsl, description)
+        return {(dsl['site_type'], dsl['style']): tuple(dsl['sections']) for dsl in dsls}
+    
+    @cached_property
+    def _compiled_pages(self):
+        """Fully specialized page template for every cached skeleton"""
+        return {
+            (site_type, style): self.compile_page({
+                'site_type': site_type,
+                'style': style,
+                'sections': list(sections)
+            })
+            for (site_type, style), sections in self._skeleton_cache.items()
+        }
+    
+    def keyword_flags(self, desc_lower):
+        """Hero, features, pricing, testimonials and contact flags of a description"""
+        # Single scan for all keywords
+        flags = [0, 0, 0, 0, 0]
+        for match in self._KW_RE.finditer(desc_lower):
+            flags[self._KW_TO_BIT[match.group(1)]] = 1
         
-        return {'dsl': dsl, 'html': html}
+        return flags
     
     def extract_features(self, description):
         """Extract features from description"""
-        desc_lower = description.lower()
+        flags = self.keyword_flags(description.lower())
         
         return [
             len(description.split()),  # num_components proxy
             len(description),  # title_length
             1,  # has_navbar (always)
-            int('hero' in desc_lower or 'landing' in desc_lower),
-            int('features' in desc_lower or 'services' in desc_lower),
+            flags[0],
+            flags[1],
             1,  # has_footer (always)
-            int('pricing' in desc_lower or 'plans' in desc_lower),
-            int('testimonial' in desc_lower or 'reviews' in desc_lower),
-            int('contact' in desc_lower),
+            flags[2],
+            flags[3],
+            flags[4],
             1, 1, 1  # counts
         ]
     
+    def extract_features_batch(self, descriptions):
+        """Feature matrix for several descriptions, same layout as extract_features"""
+        # has_navbar, has_footer and the counts are always 1
+        X = np.ones((len(descriptions), 12), dtype=np.float32)
+        
+        # Fill whole columns at once instead of boxing one row at a time. The
+        # per-row work is string scanning, which the optional numba cannot
+        # compile, so this stays on NumPy column assignment
+        X[:, 0] = [len(d.split()) for d in descriptions]
+        X[:, 1] = [len(d) for d in descriptions]
+        X[:, self._FLAG_COLUMNS] = [self.keyword_flags(d.lower()) for d in descriptions]
+        
+        return X
+    
     def select_variant_sklearn(self, site_type, style, component_type):
         """Select variant using sklearn model"""
         if component_type not in self.component_selectors:
@@ -110,8 +273,8 @@ class SklearnWebsiteGenerator(MLWebsiteGenerator):
             return defaults.get(component_type, 'default')
         
         # Encode inputs
-        site_type_enc = self.label_encoders['component_site_type'].transform([site_type])[0]
-        style_enc = self.label_encoders['component_style'].transform([style])[0]
+        site_type_enc = self._fwd['component_site_type'][site_type]
+        style_enc = self._fwd['component_style'][style]
         
         # Features
         features = [site_type_enc, style_enc, 0, 1, 1]  # has_image, has_cta, position
@@ -119,12 +282,55 @@ class SklearnWebsiteGenerator(MLWebsiteGenerator):
         # Predict
         model = self.component_selectors[component_type]
         variant_idx = model.predict([features])[0]
-        variant = self.label_encoders['variant'].inverse_transform([variant_idx])[0]
+        variant = self._inv['variant'][variant_idx]
         
         return variant
 
+    def select_variants_batch(self, dsls):
+        """Fill in section variants with one predict call per component selector"""
+        pending = {}
+        
+        for dsl in dsls:
+            for section in dsl['sections']:
+                component_type = section['type']
+                
+                if component_type not in self.component_selectors:
+                    section['variant'] = self.select_variant_sklearn(dsl['site_type'], dsl['style'], component_type)
+                    continue
+                
+                # Encode inputs
+                site_type_enc = self._fwd['component_site_type'][dsl['site_type']]
+                style_enc = self._fwd['component_style'][dsl['style']]
+                
+                # Features: has_image, has_cta, position
+                features = [site_type_enc, style_enc, 0, 1, 1]
+                pending.setdefault(component_type, []).append((section, features))
+        
+        # Predict every pending section of a component type at once
+        for component_type, items in pending.items():
+            X = np.asarray([features for _, features in items], dtype=np.float32)
+            variant_idx = self.component_selectors[component_type].predict(X)
+            variants = self._inv['variant'][variant_idx]
+            
+            for (section, _), variant in zip(items, variants):
+                section['variant'] = variant
+
+# Per-process generator for the __main__ worker pool, created by init_worker
+_worker_generator = None
+
+def init_worker():
+    """Create one generator per worker process"""
+    global _worker_generator
+    _worker_generator = SklearnWebsiteGenerator(warmup=True)
+
+def generate_test_website(job):
+    """Generate and save one test website in a worker process"""
+    i, desc = job
+    result = _worker_generator.generate_from_description(desc)
+    _worker_generator.save_website(result['html'], f'output/sklearn_website_{i}.html')
+
 if __name__ == "__main__":
-    generator = SklearnWebsiteGenerator()
+    from concurrent.futures import ProcessPoolExecutor
     
     tests = [
         "modern SaaS platform for team analytics with dashboard and pricing",
@@ -132,12 +338,7 @@ if __name__ == "__main__":
         "ecommerce store for selling organic products"
     ]
     
-    for i, desc in enumerate(tests, 1):
-        print(f"\n{'='*60}")
-        print(f"Test {i}")
-        print('='*60)
-        
-        result = generator.generate_from_description(desc)
-        generator.save_website(result['html'], f'output/sklearn_website_{i}.html')
+    with ProcessPoolExecutor(initializer=init_worker) as executor:
+        list(executor.map(generate_test_website, enumerate(tests, 1)))
 
     print("\n✅ Done!")
\ No newline at end of file
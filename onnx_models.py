@@ -0,0 +1,6 @@
+# ONNX exports of the classifiers, written by train_models.py and export_onnx.py
+# and loaded by SklearnWebsiteGenerator when onnxruntime is installed
+ONNX_MODELS = {
+    'site_type': 'models/site_type_classifier.onnx',
+    'style': 'models/style_classifier.onnx'
+}
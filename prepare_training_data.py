@@ -1,149 +1,273 @@
 import json
+import numpy as np
+from collections import Counter, defaultdict
 import pandas as pd
 from sklearn.model_selection import train_test_split
 import os
 
+try:
+    import orjson as fast_json
+except ImportError:  # orjson is optional, the stdlib parser also reads bytes
+    fast_json = json
+
+try:
+    import ijson
+except ImportError:  # ijson is optional, only needed for stream=True on .json input
+    ijson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional, pandas writes the CSVs without it
+    pa = None
+
+# Site fields the preparator reads, everything else is dropped when streaming
+SITE_FIELDS = ('title', 'site_type', 'style', 'components')
+
+# Example flags SimpleMLModels compares, stored in classifier_data.parquet
+SIMPLE_MODEL_FLAGS = ('has_navbar', 'has_hero', 'has_features', 'has_footer')
+
+def write_csv(df, path):
+    """Write df without its index, through pyarrow's C++ CSV writer when available"""
+    if pa is None:
+        df.to_csv(path, index=False)
+    else:
+        pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path)
+
 class SklearnDataPreparator:
-    def __init__(self, input_file='output/training_data_ml.json'):
-        with open(input_file) as f:
-            self.raw_data = json.load(f)
+    def __init__(self, input_file='output/training_data_ml.jsonl', stream=False):
+        with open(input_file, 'rb') as f:
+            if input_file.endswith('.jsonl'):
+                # Scraper output, one site per line
+                sites = (fast_json.loads(line) for line in f if line.strip())
+            elif stream and ijson is not None:
+                sites = ijson.items(f, 'item', use_float=True)
+            else:
+                sites = fast_json.loads(f.read())
+            
+            if stream:
+                # Keep only the fields in use, so the scraped dsl/props
+                # copies are never held in memory
+                self.raw_data = [{k: site[k] for k in SITE_FIELDS if k in site} for site in sites]
+            else:
+                self.raw_data = list(sites)
         
         print(f"Loaded {len(self.raw_data)} scraped websites")
     
-    def prepare_classifier_data(self):
-        """Prepare data for site type + style classifier"""
-        data = []
+    def sites_frame(self):
+        """One row per scraped site with the defaults applied"""
+        sites = pd.DataFrame(self.raw_data, columns=['title', 'site_type', 'style', 'components'])
+        return sites.fillna({'title': '', 'site_type': 'other', 'style': 'minimal_clean'})
+    
+    def collect_layout_rows(self):
+        """Build layout rows in one pass over raw_data"""
+        layout_rows = []
         
         for site in self.raw_data:
-            # Count component types
-            component_counts = {
-                'navbar': 0, 'hero': 0, 'features': 0, 
-                'footer': 0, 'pricing': 0, 'testimonials': 0, 'contact': 0
-            }
-            
-            for comp in site.get('components', []):
-                comp_type = comp['type']
-                if comp_type in component_counts:
-                    component_counts[comp_type] += 1
-            
-            # Create features
-            features = {
-                'num_components': len(site.get('components', [])),
-                'title_length': len(site.get('title', '')),
-                'has_navbar': component_counts['navbar'] > 0,
-                'has_hero': component_counts['hero'] > 0,
-                'has_features': component_counts['features'] > 0,
-                'has_footer': component_counts['footer'] > 0,
-                'has_pricing': component_counts['pricing'] > 0,
-                'has_testimonials': component_counts['testimonials'] > 0,
-                'has_contact': component_counts['contact'] > 0,
-                'navbar_count': component_counts['navbar'],
-                'hero_count': component_counts['hero'],
-                'features_count': component_counts['features']
-            }
-            
-            # Labels
-            labels = {
+            # Layout sequence, kept as a tuple until it is written out
+            sections = tuple(c['type'] for c in site.get('components', []))
+            layout_rows.append({
                 'site_type': site.get('site_type', 'other'),
-                'style': site.get('style', 'minimal_clean')
-            }
-            
-            data.append({**features, **labels})
+                'style': site.get('style', 'minimal_clean'),
+                'sections': sections,
+                'num_sections': len(sections)
+            })
         
-        df = pd.DataFrame(data)
+        return layout_rows
+    
+    def classifier_frame(self, sites=None):
+        """Classifier features + labels per site, with boolean has_* columns"""
+        if sites is None:
+            sites = self.sites_frame()
+        
+        # One row per component, indexed by its site, then count types per site
+        components = sites['components'].explode().dropna()
+        counts = (
+            components.str.get('type').groupby(level=0).value_counts()
+            .unstack(fill_value=0)
+            .reindex(index=sites.index, fill_value=0)
+            .astype('int16')
+        )
+        
+        def count(component_type):
+            if component_type in counts:
+                return counts[component_type]
+            return pd.Series(0, index=sites.index, dtype='int16')
+        
+        df = pd.DataFrame({
+            'num_components': sites['components'].str.len().fillna(0).astype('int16'),
+            'title_length': sites['title'].str.len()
+        })
+        
+        for component_type in ['navbar', 'hero', 'features', 'footer', 'pricing', 'testimonials', 'contact']:
+            df[f'has_{component_type}'] = count(component_type) > 0
+        
+        for component_type in ['navbar', 'hero', 'features']:
+            df[f'{component_type}_count'] = count(component_type)
+        
+        df['site_type'] = sites['site_type']
+        df['style'] = sites['style']
+        
+        return df
+    
+    def component_frame(self, sites=None):
+        """Component variant rows, one per scraped component"""
+        if sites is None:
+            sites = self.sites_frame()
+        
+        # One row per component, indexed by its site
+        components = sites['components'].explode().dropna()
+        props = pd.DataFrame(
+            components.tolist(),
+            index=components.index,
+            columns=['type', 'has_image', 'has_cta', 'position', 'confidence', 'num_items', 'has_links']
+        )
+        style = sites['style'].reindex(components.index)
         
-        # Convert boolean to int
+        df = pd.DataFrame({
+            'site_type': sites['site_type'].reindex(components.index),
+            'style': style,
+            'component_type': props['type'],
+            'has_image': props['has_image'].fillna(False).astype(bool).astype('int8'),
+            'has_cta': props['has_cta'].fillna(False).astype(bool).astype('int8'),
+            'position': props['position'].fillna(0).astype(int),
+            'confidence': props['confidence'].fillna(0.5),
+            'variant': self.infer_variants(props, style)
+        })
+        
+        return df.reset_index(drop=True)
+    
+    def prepare_classifier_data(self, df=None):
+        """Prepare data for site type + style classifier"""
+        if df is None:
+            df = self.classifier_frame()
+        
+        # Convert boolean to int, 0/1 flags only need a byte
         bool_cols = ['has_navbar', 'has_hero', 'has_features', 'has_footer', 
                      'has_pricing', 'has_testimonials', 'has_contact']
-        for col in bool_cols:
-            df[col] = df[col].astype(int)
+        df = df.astype(dict.fromkeys(bool_cols, 'int8'))
         
         # Save
         os.makedirs('training', exist_ok=True)
-        df.to_csv('training/classifier_data.csv', index=False)
+        write_csv(df, 'training/classifier_data.csv')
         print(f"✓ Saved classifier training data: {len(df)} examples")
         
         return df
     
-    def prepare_layout_generator_data(self):
+    def prepare_layout_generator_data(self, data=None):
         """Prepare layout sequence data"""
-        data = []
-        
-        for site in self.raw_data:
-            sections = [c['type'] for c in site.get('components', [])]
-            
-            data.append({
-                'site_type': site.get('site_type', 'other'),
-                'style': site.get('style', 'minimal_clean'),
-                'sections': ','.join(sections),
-                'num_sections': len(sections)
-            })
+        if data is None:
+            data = self.collect_layout_rows()
         
         df = pd.DataFrame(data)
-        df.to_csv('training/layout_generator_data.csv', index=False)
+        df['sections'] = df['sections'].str.join(',')
+        write_csv(df, 'training/layout_generator_data.csv')
         print(f"✓ Saved layout generator data: {len(df)} examples")
         
         return df
     
-    def prepare_component_selector_data(self):
+    def prepare_component_selector_data(self, df=None):
         """Prepare component variant data"""
-        data = []
+        if df is None:
+            df = self.component_frame()
         
-        for site in self.raw_data:
-            site_type = site.get('site_type', 'other')
-            style = site.get('style', 'minimal_clean')
-            
-            for component in site.get('components', []):
-                comp_type = component['type']
-                variant = self.infer_variant(component, style)
-                
-                features = {
-                    'site_type': site_type,
-                    'style': style,
-                    'component_type': comp_type,
-                    'has_image': int(component.get('has_image', False)),
-                    'has_cta': int(component.get('has_cta', False)),
-                    'position': component.get('position', 0),
-                    'confidence': component.get('confidence', 0.5),
-                    'variant': variant
-                }
-                
-                data.append(features)
-        
-        df = pd.DataFrame(data)
-        df.to_csv('training/component_selector_data.csv', index=False)
+        write_csv(df, 'training/component_selector_data.csv')
         print(f"✓ Saved component selector data: {len(df)} examples")
         
         return df
     
-    def infer_variant(self, component, style):
-        """Infer component variant"""
-        comp_type = component['type']
-        
-        if comp_type == 'navbar':
-            return 'transparent' if style == 'modern_gradient' else 'solid'
-        elif comp_type == 'hero':
-            if component.get('has_image'):
-                return 'split_screen_with_image'
-            elif component.get('has_cta'):
-                return 'centered_cta'
-            else:
-                return 'minimal_text'
-        elif comp_type == 'features':
-            num_items = component.get('num_items', 3)
-            return 'grid_4col' if num_items >= 4 else 'grid_3col'
-        elif comp_type == 'footer':
-            return 'detailed' if component.get('has_links') else 'minimal'
-        else:
-            return 'default'
+    def prepare_simple_model_data(self, classifier_rows, layout_rows, component_df):
+        """Prepare the frequency tables used by SimpleMLModels"""
+        # Aggregate with tuple keys, strings are only built for the JSON files
+        layout_counts = defaultdict(Counter)
+        for row in layout_rows:
+            # Pages without components round-trip through the CSV as NaN and
+            # the sklearn path drops them, so they never become a template
+            if row['sections']:
+                layout_counts[row['site_type']][row['sections']] += 1
+        
+        variant_counts = defaultdict(Counter)
+        for *key, variant in zip(component_df['site_type'], component_df['style'],
+                                 component_df['component_type'], component_df['variant']):
+            variant_counts[tuple(key)][variant] += 1
+        
+        # Top 3 layouts per site type
+        layout_templates = {
+            site_type: [list(sections) for sections, _ in counts.most_common(3)]
+            for site_type, counts in layout_counts.items()
+        }
+        
+        # Most common variant per (site_type, style, component_type)
+        component_variants = {
+            '_'.join(key): counts.most_common(1)[0][0]
+            for key, counts in variant_counts.items()
+        }
+        
+        os.makedirs('training', exist_ok=True)
+        
+        with open('training/classifier_data.json', 'w') as f:
+            json.dump(classifier_rows, f, indent=2)
+        
+        if pa is not None:
+            # Columnar copy SimpleMLModels loads without parsing the JSON
+            examples = pd.DataFrame(classifier_rows, columns=list(SIMPLE_MODEL_FLAGS) + ['site_type', 'style'])
+            examples = examples.astype(dict.fromkeys(SIMPLE_MODEL_FLAGS, 'uint8'))
+            pq.write_table(pa.Table.from_pandas(examples, preserve_index=False),
+                           'training/classifier_data.parquet', compression='zstd')
+        
+        with open('training/layout_templates.json', 'w') as f:
+            json.dump(layout_templates, f, indent=2)
+        
+        with open('training/component_variants.json', 'w') as f:
+            json.dump(component_variants, f, indent=2)
+        
+        print(f"✓ Saved simple model data: {len(layout_templates)} layouts, {len(component_variants)} variant rules")
+    
+    def infer_variants(self, props, style):
+        """Infer component variants for whole columns of component props"""
+        comp_type = props['type']
+        has_image = props['has_image'].fillna(False).astype(bool)
+        has_cta = props['has_cta'].fillna(False).astype(bool)
+        has_links = props['has_links'].fillna(False).astype(bool)
+        num_items = props['num_items'].fillna(3)
+        
+        # First matching condition wins, in the same order as the old
+        # per-component if/elif chain
+        conditions = [
+            (comp_type == 'navbar') & (style == 'modern_gradient'),
+            comp_type == 'navbar',
+            (comp_type == 'hero') & has_image,
+            (comp_type == 'hero') & has_cta,
+            comp_type == 'hero',
+            (comp_type == 'features') & (num_items >= 4),
+            comp_type == 'features',
+            (comp_type == 'footer') & has_links,
+            comp_type == 'footer'
+        ]
+        choices = [
+            'transparent', 'solid',
+            'split_screen_with_image', 'centered_cta', 'minimal_text',
+            'grid_4col', 'grid_3col',
+            'detailed', 'minimal'
+        ]
+        
+        return np.select(conditions, choices, default='default')
     
     def prepare_all(self):
         """Prepare all datasets"""
         print("\n=== Preparing Training Data ===\n")
         
-        classifier_df = self.prepare_classifier_data()
-        layout_df = self.prepare_layout_generator_data()
-        component_df = self.prepare_component_selector_data()
+        # Classifier and component data are computed column-wise from one
+        # frame of the scraped sites
+        sites = self.sites_frame()
+        classifier_frame = self.classifier_frame(sites)
+        layout_rows = self.collect_layout_rows()
+        
+        classifier_df = self.prepare_classifier_data(classifier_frame)
+        layout_df = self.prepare_layout_generator_data(layout_rows)
+        component_df = self.prepare_component_selector_data(self.component_frame(sites))
+        self.prepare_simple_model_data(classifier_frame.to_dict('records'), layout_rows, component_df)
         
         # Statistics
         print("\n=== Dataset Statistics ===")
@@ -0,0 +1,16 @@
+import joblib
+
+# Rewrite models saved by older versions of train_models.py in the format
+# save_models writes now (zlib-compressed, pickle protocol 5)
+MODEL_FILES = [
+    'models/site_type_classifier.pkl',
+    'models/style_classifier.pkl',
+    'models/component_selectors.pkl',
+    'models/label_encoders.pkl'
+]
+
+if __name__ == "__main__":
+    for path in MODEL_FILES:
+        model = joblib.load(path)
+        joblib.dump(model, path, compress=3, protocol=5)
+        print(f"✓ Repacked {path}")
@@ -1,50 +1,47 @@
-import json
-import requests
+import asyncio
 from bs4 import BeautifulSoup
+from scraper_base import BaseScraper, BTN_CLASS_RE, FEATURE_CLASS_RE, stripped_text_length
 
-class SimpleWebsiteScraper:
-    def __init__(self):
-        pass
+class SimpleWebsiteScraper(BaseScraper):
+    def parse_page(self, url, content):
+        """Extract layout data from a downloaded page"""
+        soup = BeautifulSoup(content, 'lxml')
         
-    def scrape_site(self, url):
-        """Scrape one website and extract layout data"""
-        print(f"Scraping: {url}")
+        title_tag = soup.find('title')
+        title = title_tag.text if title_tag else ""
         
-        try:
-            response = requests.get(url, timeout=10, headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            })
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            title = soup.find('title').text if soup.find('title') else ""
-            site_type = self.detect_site_type(soup, title)
-            components = self.extract_components(soup)
-            dsl = self.generate_dsl(components)
-            
-            return {
-                'url': url,
-                'title': title,
-                'site_type': site_type,
-                'components': components,
-                'dsl': dsl
-            }
-            
-        except Exception as e:
-            print(f"  Error: {e}")
-            return None
+        # Walk the DOM for the page text once, helpers take it as an argument
+        text = soup.get_text().lower()
+        
+        site_type = self.detect_site_type(text, title)
+        components = self.extract_components(soup)
+        dsl = self.generate_dsl(components)
+        
+        return {
+            'url': url,
+            'title': title,
+            'site_type': site_type,
+            'components': components,
+            'dsl': dsl
+        }
     
-    def detect_site_type(self, soup, title):
-        text = (title + ' ' + soup.get_text()).lower()
+    def detect_site_type(self, page_text, title):
+        title = title.lower()
         
-        if any(word in text for word in ['saas', 'software', 'platform', 'analytics']):
+        def mentions(words):
+            # Keywords have no spaces, so searching the title and the page text
+            # separately finds the same words without copying the page
+            return any(word in title or word in page_text for word in words)
+        
+        if mentions(['saas', 'software', 'platform', 'analytics']):
             return 'saas_landing'
-        elif any(word in text for word in ['portfolio', 'designer', 'photographer', 'work']):
+        elif mentions(['portfolio', 'designer', 'photographer', 'work']):
             return 'portfolio'
-        elif any(word in text for word in ['shop', 'store', 'buy', 'cart', 'product']):
+        elif mentions(['shop', 'store', 'buy', 'cart', 'product']):
             return 'ecommerce'
-        elif any(word in text for word in ['blog', 'article', 'post']):
+        elif mentions(['blog', 'article', 'post']):
             return 'blog'
-        elif any(word in text for word in ['restaurant', 'menu', 'food', 'dining']):
+        elif mentions(['restaurant', 'menu', 'food', 'dining']):
             return 'restaurant'
         else:
             return 'corporate'
@@ -63,26 +60,26 @@ class SimpleWebsiteScraper:
         
         hero_candidates = soup.find_all(['section', 'div'], limit=5)
         for section in hero_candidates:
-            text = section.get_text(strip=True)
-            if len(text) > 50 and len(text) < 500:
-                has_cta = section.find(['button', 'a'], class_=lambda x: x and 'btn' in str(x).lower())
+            # Large wrappers are rejected without joining their whole text
+            text_length = stripped_text_length(section, 500)
+            if text_length > 50 and text_length < 500:
+                has_cta = section.find(['button', 'a'], class_=BTN_CLASS_RE)
                 components.append({
                     'type': 'hero',
                     'position': len(components),
                     'has_image': section.find('img') is not None,
                     'has_cta': has_cta is not None,
-                    'text_length': len(text)
+                    'text_length': text_length
                 })
                 break
         
-        sections = soup.find_all(['section', 'div'], class_=lambda x: x and any(
-            keyword in str(x).lower() for keyword in ['feature', 'benefit', 'service']
-        ))
-        if sections:
+        # Only the first match is used, find stops walking the tree there
+        feature_section = soup.find(['section', 'div'], class_=FEATURE_CLASS_RE)
+        if feature_section:
             components.append({
                 'type': 'features',
                 'position': len(components),
-                'num_items': len(sections[0].find_all(['div', 'article'], recursive=False))
+                'num_items': len(feature_section.find_all(['div', 'article'], recursive=False))
             })
         
         footer = soup.find('footer')
@@ -107,30 +104,6 @@ class SimpleWebsiteScraper:
                 for c in components
             ]
         }
-    
-    def scrape_batch(self, urls, output_file='output/training_data.json'):
-        results = []
-        
-        for i, url in enumerate(urls):
-            print(f"\n[{i+1}/{len(urls)}]")
-            data = self.scrape_site(url)
-            
-            if data:
-                results.append(data)
-                
-                if len(results) % 10 == 0:
-                    self.save_results(results, output_file)
-                    print(f"  ✓ Saved {len(results)} sites")
-        
-        self.save_results(results, output_file)
-        print(f"\n✅ Complete! Scraped {len(results)}/{len(urls)} sites")
-        return results
-    
-    def save_results(self, results, filename):
-        import os
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
-        with open(filename, 'w') as f:
-            json.dump(results, f, indent=2)
 
 if __name__ == "__main__":
     try:
@@ -142,5 +115,5 @@ if __name__ == "__main__":
     
     print(f"Found {len(urls)} URLs to scrape")
     scraper = SimpleWebsiteScraper()
-    scraper.scrape_batch(urls[:100])
+    asyncio.run(scraper.scrape_batch_async(urls[:100]))
 
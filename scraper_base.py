@@ -0,0 +1,250 @@
+import json
+import asyncio
+import contextlib
+import os
+import shelve
+import time
+import httpx
+import re
+import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional, callers fall back to str.count without it
+    ahocorasick = None
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# Class name patterns, matched in C by BeautifulSoup instead of calling a
+# Python lambda per tag. ASCII-only case folding matches str.lower() here
+BTN_CLASS_RE = re.compile(r'btn', re.IGNORECASE | re.ASCII)
+FEATURE_CLASS_RE = re.compile(r'feature|benefit|service', re.IGNORECASE | re.ASCII)
+
+def stripped_text_length(tag, limit):
+    """len(tag.get_text(strip=True)), counting stops once it reaches limit"""
+    length = 0
+    for string in tag.stripped_strings:
+        length += len(string)
+        if length >= limit:
+            break
+    
+    return length
+
+def build_automaton(keywords_dict):
+    """Aho-Corasick automaton over all keywords, None without pyahocorasick"""
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for category, keywords in keywords_dict.items():
+        for keyword in keywords:
+            automaton.add_word(keyword, (category, keyword))
+    automaton.make_automaton()
+    
+    return automaton
+
+class BaseScraper:
+    """Fetching, caching and checkpointing shared by the scrapers, subclasses implement parse_page"""
+    
+    # Default NDJSON output of scrape_batch and scrape_batch_async
+    output_file = 'output/training_data.jsonl'
+    
+    def __init__(self, max_workers=32, cache_file='output/scrape_cache', cache_ttl=86400):
+        self.max_workers = max_workers
+        
+        # Parse results are kept on disk per URL for cache_ttl seconds so
+        # reruns and interrupted runs skip pages already scraped
+        self.cache_file = cache_file
+        self.cache_ttl = cache_ttl
+        
+        # One pooled session shared by all scraping threads
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = USER_AGENT
+        
+        # Keep one idle connection per thread, the default pool of 10 per
+        # host drops the rest and re-handshakes on same-host URLs
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+    def scrape_site(self, url):
+        """Scrape one website and extract layout data"""
+        print(f"Scraping: {url}")
+        
+        try:
+            response = self.session.get(url, timeout=10)
+            return self.parse_page(url, response.content)
+            
+        except Exception as e:
+            print(f"  Error: {e}")
+            return None
+    
+    async def scrape_site_async(self, client, url, semaphore):
+        """Async scrape_site on a shared httpx client"""
+        print(f"Scraping: {url}")
+        
+        try:
+            async with semaphore:
+                response = await client.get(url, timeout=10)
+            
+            # Parsing is CPU-bound, keep it off the event loop
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.parse_page, url, response.content)
+            
+        except Exception as e:
+            print(f"  Error: {e}")
+            return None
+    
+    def parse_page(self, url, content):
+        """Extract layout data from a downloaded page"""
+        raise NotImplementedError
+    
+    def scrape_batch(self, urls, output_file=None):
+        """Scrape urls on a thread pool, checkpointing each site to output_file"""
+        output_file = output_file or self.output_file
+        results = []
+        
+        # Sites already in output_file from an earlier run are kept, not redone
+        saved = self.load_checkpoint(output_file)
+        
+        with self.open_cache() as cache, open(output_file, 'a') as out:
+            cached = self.cached_results(cache, [url for url in urls if url not in saved])
+            
+            # Fetch cache misses concurrently; map yields in URL order so
+            # results, checkpoints and the cache are only touched from this thread
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                fetched = executor.map(self.scrape_site, [url for url in urls if url not in saved and url not in cached])
+                
+                for i, url in enumerate(urls):
+                    print(f"\n[{i+1}/{len(urls)}]")
+                    
+                    if url in saved:
+                        results.append(saved[url])
+                        continue
+                    
+                    if url in cached:
+                        data = cached[url]
+                    else:
+                        data = next(fetched)
+                        if data:
+                            cache[url] = (time.time(), data)
+                    
+                    if not data:
+                        continue
+                    
+                    results.append(data)
+                    
+                    # Append-only checkpoint, each finished site is one line
+                    out.write(json.dumps(data) + '\n')
+                    out.flush()
+                    
+                    if len(results) % 10 == 0:
+                        print(f"  ✓ Saved {len(results)} sites")
+        
+        print(f"\n✅ Complete! Scraped {len(results)}/{len(urls)} sites")
+        return results
+    
+    async def scrape_batch_async(self, urls, output_file=None, concurrency=64):
+        """scrape_batch on asyncio + httpx, each site is checkpointed as it completes"""
+        output_file = output_file or self.output_file
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        # Sites already in output_file from an earlier run are kept, not redone
+        saved = self.load_checkpoint(output_file)
+        
+        with self.open_cache() as cache, open(output_file, 'a') as out:
+            cached = self.cached_results(cache, [url for url in urls if url not in saved])
+            
+            def checkpoint(data):
+                # Append-only checkpoint, each finished site is one line
+                out.write(json.dumps(data) + '\n')
+                out.flush()
+            
+            for url in urls:
+                if url in cached:
+                    checkpoint(cached[url])
+            
+            # Dispatch same-host URLs together so they share keep-alive
+            # connections, multiplexed over HTTP/2 where the server supports it
+            misses = sorted((url for url in urls if url not in saved and url not in cached),
+                            key=lambda url: urlparse(url).netloc)
+            limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency, keepalive_expiry=30)
+            
+            async with httpx.AsyncClient(headers={'User-Agent': USER_AGENT}, follow_redirects=True,
+                                         http2=True, limits=limits) as client:
+                async def fetch(url):
+                    return url, await self.scrape_site_async(client, url, semaphore)
+                
+                # Handle pages as they finish, so each one is in the cache and
+                # the output even if the run is interrupted before the rest complete
+                for page in asyncio.as_completed([fetch(url) for url in misses]):
+                    url, data = await page
+                    if not data:
+                        continue
+                    
+                    cache[url] = (time.time(), data)
+                    cached[url] = data
+                    checkpoint(data)
+                    
+                    if len(cached) % 10 == 0:
+                        print(f"  ✓ Saved {len(cached)} sites")
+        
+        # Returned in URL order, the output file is in completion order
+        cached.update(saved)
+        results = [cached[url] for url in urls if url in cached]
+        
+        print(f"\n✅ Complete! Scraped {len(results)}/{len(urls)} sites")
+        return results
+    
+    def load_checkpoint(self, output_file):
+        """Sites per URL already in an NDJSON output file, empty if there is none"""
+        os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
+        
+        try:
+            with open(output_file, 'rb+') as f:
+                lines = f.read()
+                
+                # A run killed mid-write leaves a partial last line, drop it
+                # so appended lines start on their own line
+                complete = lines.rfind(b'\n') + 1
+                if complete < len(lines):
+                    f.truncate(complete)
+        except FileNotFoundError:
+            return {}
+        
+        saved = {}
+        for line in lines[:complete].splitlines():
+            if line.strip():
+                data = json.loads(line)
+                saved[data['url']] = data
+        
+        if saved:
+            print(f"  ✓ {len(saved)} sites already in {output_file}")
+        
+        return saved
+    
+    def open_cache(self):
+        """Open the per-URL result cache, a throwaway dict if caching is off"""
+        if not self.cache_file:
+            return contextlib.nullcontext({})
+        
+        os.makedirs(os.path.dirname(self.cache_file) or '.', exist_ok=True)
+        return shelve.open(self.cache_file)
+    
+    def cached_results(self, cache, urls):
+        """Unexpired cached results for urls"""
+        now = time.time()
+        cached = {}
+        
+        for url in urls:
+            entry = cache.get(url)
+            if entry is not None and now - entry[0] < self.cache_ttl:
+                cached[url] = entry[1]
+        
+        if cached:
+            print(f"  ✓ {len(cached)} sites cached")
+        
+        return cached
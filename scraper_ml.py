@@ -1,11 +1,14 @@
-import json
-import requests
+import asyncio
 from bs4 import BeautifulSoup
-from collections import Counter
-import re
+from scraper_base import BaseScraper, BTN_CLASS_RE, FEATURE_CLASS_RE, build_automaton, stripped_text_length
 
-class LightweightMLScraper:
-    def __init__(self):
+class LightweightMLScraper(BaseScraper):
+    # Default NDJSON output of scrape_batch and scrape_batch_async
+    output_file = 'output/training_data_ml.jsonl'
+    
+    def __init__(self, max_workers=32, cache_file='output/scrape_cache_ml', cache_ttl=86400):
+        super().__init__(max_workers, cache_file, cache_ttl)
+        
         # Simple keyword-based "ML" (fast, no dependencies)
         self.site_type_keywords = {
             'saas_landing': ['saas', 'platform', 'software', 'analytics', 'dashboard', 'api', 'integration'],
@@ -24,51 +27,54 @@ class LightweightMLScraper:
             'glassmorphism': ['glass', 'blur', 'transparent']
         }
         
-    def scrape_site(self, url):
-        print(f"Scraping: {url}")
+        # One automaton per keyword dict, scans the page text once
+        self.site_type_automaton = build_automaton(self.site_type_keywords)
         
-        try:
-            response = requests.get(url, timeout=10, headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            })
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            title = soup.find('title').text if soup.find('title') else ""
-            text = soup.get_text().lower()
-            
-            # Classify site type with confidence
-            site_type = self.classify_with_confidence(text, self.site_type_keywords)
-            
-            # Detect style with confidence
-            style = self.detect_style(soup)
-            
-            # Extract components
-            components = self.extract_components(soup)
-            
-            dsl = self.generate_dsl(components, style)
-            
-            return {
-                'url': url,
-                'title': title,
-                'site_type': site_type['label'],
-                'site_type_confidence': site_type['confidence'],
-                'style': style['label'],
-                'style_confidence': style['confidence'],
-                'components': components,
-                'dsl': dsl
-            }
-            
-        except Exception as e:
-            print(f"  Error: {e}")
-            return None
+    def parse_page(self, url, content):
+        """Extract layout data from a downloaded page"""
+        soup = BeautifulSoup(content, 'lxml')
+        
+        title_tag = soup.find('title')
+        title = title_tag.text if title_tag else ""
+        text = soup.get_text().lower()
+        
+        # Classify site type with confidence
+        site_type = self.classify_with_confidence(text, self.site_type_keywords, self.site_type_automaton)
+        
+        # Detect style with confidence
+        style = self.detect_style(soup)
+        
+        # Extract components
+        components = self.extract_components(soup)
+        
+        dsl = self.generate_dsl(components, style)
+        
+        return {
+            'url': url,
+            'title': title,
+            'site_type': site_type['label'],
+            'site_type_confidence': site_type['confidence'],
+            'style': style['label'],
+            'style_confidence': style['confidence'],
+            'components': components,
+            'dsl': dsl
+        }
     
-    def classify_with_confidence(self, text, keywords_dict):
+    def classify_with_confidence(self, text, keywords_dict, automaton=None):
         """Score-based classification with confidence"""
-        scores = {}
-        
-        for category, keywords in keywords_dict.items():
-            score = sum(text.count(keyword) for keyword in keywords)
-            scores[category] = score
+        scores = dict.fromkeys(keywords_dict, 0)
+        
+        if automaton is not None:
+            # Single pass over text; skip matches overlapping the previous
+            # one of the same keyword to keep str.count semantics
+            last_end = {}
+            for end, (category, keyword) in automaton.iter(text):
+                if end - len(keyword) >= last_end.get(keyword, -1):
+                    scores[category] += 1
+                    last_end[keyword] = end
+        else:
+            for category, keywords in keywords_dict.items():
+                scores[category] = sum(text.count(keyword) for keyword in keywords)
         
         total_score = sum(scores.values()) or 1
         best_category = max(scores, key=scores.get)
@@ -137,9 +143,10 @@ class LightweightMLScraper:
         # Hero
         hero_candidates = soup.find_all(['section', 'div'], limit=5)
         for section in hero_candidates:
-            text = section.get_text(strip=True)
-            if 50 < len(text) < 500:
-                has_cta = section.find(['button', 'a'], class_=lambda x: x and 'btn' in str(x).lower())
+            # Large wrappers are rejected without joining their whole text
+            text_length = stripped_text_length(section, 500)
+            if 50 < text_length < 500:
+                has_cta = section.find(['button', 'a'], class_=BTN_CLASS_RE)
                 components.append({
                     'type': 'hero',
                     'position': len(components),
@@ -150,15 +157,14 @@ class LightweightMLScraper:
                 break
         
         # Features
-        feature_sections = soup.find_all(['section', 'div'], class_=lambda x: x and any(
-            keyword in str(x).lower() for keyword in ['feature', 'benefit', 'service']
-        ))
-        if feature_sections:
+        # Only the first match is used, find stops walking the tree there
+        feature_section = soup.find(['section', 'div'], class_=FEATURE_CLASS_RE)
+        if feature_section:
             components.append({
                 'type': 'features',
                 'position': len(components),
                 'confidence': 0.8,
-                'num_items': len(feature_sections[0].find_all(['div', 'article'], recursive=False))
+                'num_items': len(feature_section.find_all(['div', 'article'], recursive=False))
             })
         
         # Footer
@@ -188,30 +194,6 @@ class LightweightMLScraper:
                 for c in components
             ]
         }
-    
-    def scrape_batch(self, urls, output_file='output/training_data_ml.json'):
-        results = []
-        
-        for i, url in enumerate(urls):
-            print(f"\n[{i+1}/{len(urls)}]")
-            data = self.scrape_site(url)
-            
-            if data:
-                results.append(data)
-                
-                if len(results) % 10 == 0:
-                    self.save_results(results, output_file)
-                    print(f"  ✓ Saved {len(results)} sites")
-        
-        self.save_results(results, output_file)
-        print(f"\n✅ Complete! Scraped {len(results)}/{len(urls)} sites")
-        return results
-    
-    def save_results(self, results, filename):
-        import os
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
-        with open(filename, 'w') as f:
-            json.dump(results, f, indent=2)
 
 if __name__ == "__main__":
     try:
@@ -224,4 +206,4 @@ if __name__ == "__main__":
     print(f"Found {len(urls)} URLs to scrape\n")
     
     scraper = LightweightMLScraper()
-    scraper.scrape_batch(urls[:150])
\ No newline at end of file
+    asyncio.run(scraper.scrape_batch_async(urls[:150]))
\ No newline at end of file
@@ -1,100 +1,352 @@
 import json
 import os
+import pickle
+import sys
+import tempfile
+from functools import lru_cache
+import numpy as np
+
+try:
+    import orjson as fast_json
+except ImportError:  # orjson is optional, the stdlib parser also reads bytes
+    fast_json = json
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional, substring checks are used without it
+    ahocorasick = None
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional, classifier_data.json is parsed without it
+    pq = None
+
+# Example count from which the compiled scorer beats the NumPy column passes,
+# below it the JIT dispatch is not worth the first-call compile
+NUMBA_MIN_EXAMPLES = 5000
+
+# Compiled scorer, built on the first classify_site call with enough examples
+# so importing this module never pays for numba. False once numba is missing
+_score_examples = None
+
+
+def _score_examples_kernel():
+    """Compile the numba scorer once, None when numba is not installed"""
+    global _score_examples
+    if _score_examples is None:
+        try:
+            from numba import njit
+        except ImportError:  # numba is optional, classify_site scores with NumPy without it
+            _score_examples = False
+            return None
+        
+        @njit(cache=True)
+        def score_examples(feat_matrix, site_idx, n_site_types, query):
+            """Summed feature matches per site type, query is -1 for missing features"""
+            scores = np.zeros(n_site_types, np.int64)
+            for i in range(feat_matrix.shape[0]):
+                similarity = 0
+                for j in range(feat_matrix.shape[1]):
+                    if feat_matrix[i, j] == query[j]:
+                        similarity += 1
+                scores[site_idx[i]] += similarity
+            return scores
+        
+        _score_examples = score_examples
+    return _score_examples or None
+
+# Prepared training data, in the order load_training_data reads it
+TRAINING_FILES = (
+    'training/classifier_data.json',
+    'training/layout_templates.json',
+    'training/component_variants.json'
+)
+
+# Columnar copy of classifier_data.json written by prepare_training_data.py,
+# read instead of the JSON when pyarrow is installed
+CLASSIFIER_PARQUET = 'training/classifier_data.parquet'
+
+# Pickled training data plus the indices derived from it, rebuilt whenever
+# a training file is newer
+CACHE_FILE = 'models/simple_ml_cache.pkl'
+
+# Layout of the cached dict, bump whenever the cached fields change so
+# pickles from older code are rebuilt instead of reused
+CACHE_VERSION = 2
+
+# Description keywords and the feature flag each one sets
+_DESCRIPTION_KEYWORDS = {
+    'hero': 'has_hero', 'landing': 'has_hero', 'main': 'has_hero',
+    'features': 'has_features', 'services': 'has_features', 'benefits': 'has_features'
+}
+
+# All description keywords in one automaton, matched in a single pass
+if ahocorasick is not None:
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _word, _feature in _DESCRIPTION_KEYWORDS.items():
+        _KEYWORD_AUTOMATON.add_word(_word, _feature)
+    _KEYWORD_AUTOMATON.make_automaton()
+else:
+    _KEYWORD_AUTOMATON = None
+
+def _first_seen_codes(values):
+    """Integer code per value plus the distinct values, in first-seen order"""
+    names = list(dict.fromkeys(values))
+    position = {name: i for i, name in enumerate(names)}
+    return np.array([position[value] for value in values], dtype=np.intp), names
+
+def _dictionary_codes(column):
+    """_first_seen_codes for a pyarrow string column, encoded in C++"""
+    # dictionary_encode numbers values in order of appearance
+    encoded = column.combine_chunks().dictionary_encode()
+    return encoded.indices.to_numpy().astype(np.intp), encoded.dictionary.to_pylist()
+
+def copy_dsl(dsl):
+    """Copy of a DSL dict and its section dicts, for handing out cached DSLs"""
+    return {**dsl, 'sections': [dict(section) for section in dsl['sections']]}
 
 class SimpleMLModels:
     """Rule-based models using frequency analysis (no sklearn needed)"""
     
+    # Example fields compared by classify_site, in feature matrix column order
+    _FEATURE_COLUMNS = ('has_navbar', 'has_hero', 'has_features', 'has_footer')
+    
+    # Default variants for combinations without a learned rule
+    _DEFAULT_VARIANTS = {
+        'navbar': 'solid',
+        'hero': 'centered_cta',
+        'features': 'grid_3col',
+        'footer': 'minimal'
+    }
+    
+    # Layout for site types without learned templates
+    _DEFAULT_LAYOUT = ('navbar', 'hero', 'features', 'footer')
+    
+    # Attributes stored in CACHE_FILE by _save_cache
+    _CACHED_FIELDS = (
+        'layout_templates', 'component_variants',
+        '_feat_matrix', '_site_names', '_site_idx', '_best_style'
+    )
+    
     def __init__(self):
         self.load_training_data()
     
     def load_training_data(self):
         """Load prepared training data"""
-        with open('training/classifier_data.json') as f:
-            self.classifier_data = json.load(f)
+        cached = self._read_cache()
+        if cached is not None:
+            # Parsed data and derived indices from an earlier load
+            for name in self._CACHED_FIELDS:
+                setattr(self, name, cached[name])
+        else:
+            self._build_indices(*self._load_examples())
+            
+            with open(TRAINING_FILES[1], 'rb') as f:
+                self.layout_templates = fast_json.loads(f.read())
+            
+            with open(TRAINING_FILES[2], 'rb') as f:
+                self.component_variants = fast_json.loads(f.read())
+            
+            self._save_cache()
         
-        with open('training/layout_templates.json') as f:
-            self.layout_templates = json.load(f)
+        # Read-only layouts as tuples, section names interned so the variant
+        # lookups keyed on them compare by identity
+        self.layout_templates = {
+            site_type: [tuple(sys.intern(section) for section in layout) for layout in layouts]
+            for site_type, layouts in self.layout_templates.items()
+        }
+        
+        # Variants per (site_type, style, component_type), filled by select_variant
+        self._variant_by_key = {}
         
-        with open('training/component_variants.json') as f:
-            self.component_variants = json.load(f)
+        # DSLs per lower-cased description, reset whenever the data is loaded
+        self._dsl_cached = lru_cache(maxsize=1024)(self._generate_dsl_uncached)
         
         print("✓ Loaded training data")
     
+    def _load_examples(self):
+        """Feature matrix plus site type and style codes of the classifier examples"""
+        # The parquet may be the only copy, otherwise skip it if the JSON is newer
+        if pq is not None and os.path.exists(CLASSIFIER_PARQUET) and (
+                not os.path.exists(TRAINING_FILES[0])
+                or os.path.getmtime(CLASSIFIER_PARQUET) >= os.path.getmtime(TRAINING_FILES[0])):
+            # Whole columns straight into arrays, no per-example dicts
+            table = pq.read_table(CLASSIFIER_PARQUET)
+            feat_matrix = np.column_stack(
+                [table.column(column).to_numpy() for column in self._FEATURE_COLUMNS]
+            ).astype(np.uint8, copy=False).reshape(-1, len(self._FEATURE_COLUMNS))
+            
+            return (feat_matrix, *_dictionary_codes(table.column('site_type')),
+                    *_dictionary_codes(table.column('style')))
+        
+        with open(TRAINING_FILES[0], 'rb') as f:
+            examples = fast_json.loads(f.read())
+        
+        feat_matrix = np.array(
+            [[example[column] for column in self._FEATURE_COLUMNS] for example in examples],
+            dtype=np.uint8
+        ).reshape(-1, len(self._FEATURE_COLUMNS))
+        
+        return (feat_matrix, *_first_seen_codes([example['site_type'] for example in examples]),
+                *_first_seen_codes([example['style'] for example in examples]))
+    
+    def _build_indices(self, feat_matrix, site_idx, site_names, style_idx, style_names):
+        """Derive the lookup structures classify_site reads from the example columns"""
+        # Examples as one uint8 row each, plus the index of their site type in
+        # first-seen order so ties resolve like the old per-example loop
+        self._feat_matrix = feat_matrix
+        self._site_idx = site_idx
+        self._site_names = site_names
+        
+        # Most common style per site type, ties go to the style seen first
+        # for that site type
+        n_examples = len(site_idx)
+        counts = np.zeros((len(site_names), len(style_names)), dtype=np.int64)
+        np.add.at(counts, (site_idx, style_idx), 1)
+        first_seen = np.full(counts.shape, n_examples, dtype=np.int64)
+        np.minimum.at(first_seen, (site_idx, style_idx), np.arange(n_examples))
+        
+        is_top = counts == counts.max(axis=1, keepdims=True, initial=0)
+        best = np.where(is_top, first_seen, n_examples).argmin(axis=1)
+        self._best_style = {site_type: style_names[j] for site_type, j in zip(site_names, best)}
+    
+    def _cache_is_fresh(self):
+        """Whether CACHE_FILE is newer than every training file"""
+        try:
+            cache_mtime = os.path.getmtime(CACHE_FILE)
+        except OSError:
+            return False
+        
+        # Either classifier copy can be the source, so only the ones present count
+        inputs = [path for path in (*TRAINING_FILES, CLASSIFIER_PARQUET) if os.path.exists(path)]
+        return all(os.path.getmtime(path) < cache_mtime for path in inputs)
+    
+    def _read_cache(self):
+        """Cached fields from CACHE_FILE, None if it is stale, unreadable or from other code"""
+        if not self._cache_is_fresh():
+            return None
+        
+        try:
+            with open(CACHE_FILE, 'rb') as f:
+                cached = pickle.load(f)
+        except Exception:  # a truncated or corrupt pickle can fail in many ways, rebuild it
+            return None
+        
+        if not isinstance(cached, dict) or cached.get('version') != CACHE_VERSION:
+            return None
+        
+        return cached
+    
+    def _save_cache(self):
+        """Snapshot the parsed data and derived indices to CACHE_FILE"""
+        cache_dir = os.path.dirname(CACHE_FILE)
+        cached = {name: getattr(self, name) for name in self._CACHED_FIELDS}
+        cached['version'] = CACHE_VERSION
+        
+        # Write a temp file next to the cache and swap it in, so processes
+        # loading concurrently never see a half-written pickle
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix='.simple_ml_cache.', suffix='.tmp')
+        except OSError as e:
+            print(f"⚠ Could not write {CACHE_FILE}: {e}")
+            return
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(cached, f, protocol=5)
+            os.replace(tmp_path, CACHE_FILE)
+        except OSError as e:
+            # Read-only or full disk, the indices stay usable in memory
+            os.remove(tmp_path)
+            print(f"⚠ Could not write {CACHE_FILE}: {e}")
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+    
     def classify_site(self, features):
         """Classify site type and style based on features"""
-        # Score each site type based on similarity
-        scores = {}
-        
-        for example in self.classifier_data:
-            site_type = example['site_type']
-            
-            # Calculate similarity
-            similarity = 0
-            if features.get('has_navbar') == example['has_navbar']:
-                similarity += 1
-            if features.get('has_hero') == example['has_hero']:
-                similarity += 1
-            if features.get('has_features') == example['has_features']:
-                similarity += 1
-            if features.get('has_footer') == example['has_footer']:
-                similarity += 1
+        kernel = _score_examples_kernel() if len(self._feat_matrix) >= NUMBA_MIN_EXAMPLES else None
+        if kernel is not None:
+            # One compiled pass over all examples
+            query = np.array(
+                [-1 if features.get(column) is None else features[column] for column in self._FEATURE_COLUMNS],
+                dtype=np.int16
+            )
+            scores = kernel(self._feat_matrix, self._site_idx, len(self._site_names), query)
+        else:
+            # Score each site type based on similarity, one column at a time over
+            # all examples. Missing features match nothing, as with == None before
+            similarity = np.zeros(len(self._feat_matrix), dtype=np.int32)
+            for j, column in enumerate(self._FEATURE_COLUMNS):
+                value = features.get(column)
+                if value is not None:
+                    similarity += self._feat_matrix[:, j] == value
             
-            scores[site_type] = scores.get(site_type, 0) + similarity
+            scores = np.bincount(self._site_idx, weights=similarity, minlength=len(self._site_names))
         
         # Most common site type
-        best_site_type = max(scores.items(), key=lambda x: x[1])[0]
-        
-        # Get most common style for this site type
-        styles = {}
-        for example in self.classifier_data:
-            if example['site_type'] == best_site_type:
-                style = example['style']
-                styles[style] = styles.get(style, 0) + 1
+        best = int(np.argmax(scores))
+        best_site_type = self._site_names[best]
         
-        best_style = max(styles.items(), key=lambda x: x[1])[0] if styles else 'minimal_clean'
+        # Most common style for this site type, precomputed at load
+        best_style = self._best_style.get(best_site_type, 'minimal_clean')
         
         return {
             'site_type': best_site_type,
             'style': best_style,
-            'confidence': scores[best_site_type] / sum(scores.values())
+            'confidence': float(scores[best]) / float(scores.sum())
         }
     
     def generate_layout(self, site_type, style):
         """Generate layout sections for site type"""
-        if site_type in self.layout_templates:
+        layouts = self.layout_templates.get(site_type)
+        if layouts:
             # Return most common layout
-            return self.layout_templates[site_type][0]
-        else:
-            # Default layout
-            return ['navbar', 'hero', 'features', 'footer']
+            return layouts[0]
+        
+        return self._DEFAULT_LAYOUT
     
     def select_variant(self, site_type, style, component_type):
         """Select variant for component"""
-        key = f"{site_type}_{style}_{component_type}"
+        key = (site_type, style, component_type)
         
-        if key in self.component_variants:
-            return self.component_variants[key]
-        else:
-            # Default variants
-            defaults = {
-                'navbar': 'solid',
-                'hero': 'centered_cta',
-                'features': 'grid_3col',
-                'footer': 'minimal'
-            }
-            return defaults.get(component_type, 'default')
+        variant = self._variant_by_key.get(key)
+        if variant is None:
+            # First lookup of this combination, resolve the joined string key
+            # once. Site types and styles contain '_', so the file keys can't
+            # be split back into tuples up front
+            variant = self.component_variants.get(
+                f"{site_type}_{style}_{component_type}",
+                self._DEFAULT_VARIANTS.get(component_type, 'default')
+            )
+            self._variant_by_key[key] = variant
+        
+        return variant
     
     def generate_complete_dsl(self, user_description):
-        """Generate complete DSL from user description"""
+        """Generate complete DSL from user description, a fresh copy on every call"""
+        # The DSL only depends on the lower-cased text, repeats are served
+        # from the cache and copied so callers can't change the cached one
+        return copy_dsl(self._dsl_cached(user_description.lower()))
+    
+    def _generate_dsl_uncached(self, desc_lower):
+        """Build the DSL for a lower-cased description"""
         # Extract features from description
-        desc_lower = user_description.lower()
         features = {
             'has_navbar': True,  # Always assume navbar
-            'has_hero': any(word in desc_lower for word in ['hero', 'landing', 'main']),
-            'has_features': any(word in desc_lower for word in ['features', 'services', 'benefits']),
+            'has_hero': False,
+            'has_features': False,
             'has_footer': True  # Always assume footer
         }
         
+        if _KEYWORD_AUTOMATON is not None:
+            for _, feature in _KEYWORD_AUTOMATON.iter(desc_lower):
+                features[feature] = True
+        else:
+            for word, feature in _DESCRIPTION_KEYWORDS.items():
+                if word in desc_lower:
+                    features[feature] = True
+        
         # Classify
         classification = self.classify_site(features)
         
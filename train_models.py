@@ -1,5 +1,6 @@
 import pandas as pd
 import numpy as np
+from sklearn.tree import DecisionTreeClassifier
 from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
 from sklearn.model_selection import train_test_split, cross_val_score
 from sklearn.preprocessing import LabelEncoder
@@ -7,6 +8,37 @@ from sklearn.metrics import classification_report, accuracy_score, confusion_mat
 import joblib
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
+from onnx_models import ONNX_MODELS
+
+try:
+    from export_onnx import export_model
+except ImportError:  # skl2onnx is optional, the generator uses the pickles without it
+    export_model = None
+
+try:
+    import pyarrow
+except ImportError:  # pyarrow is optional, pandas' own C parser is used without it
+    pyarrow = None
+
+# Component types with fewer examples get one decision tree instead of a
+# forest, 50 trees on a few dozen rows cost more without predicting better
+SINGLE_TREE_MAX_EXAMPLES = 200
+
+def read_csv(path):
+    """Read a training CSV, through pyarrow's multithreaded parser when available"""
+    if pyarrow is None:
+        return pd.read_csv(path)
+    return pd.read_csv(path, engine='pyarrow')
+
+def encode_labels(values):
+    """Codes and a fitted LabelEncoder for a column, encoded through pandas Categorical"""
+    # Categories are sorted like LabelEncoder.classes_, so the codes match
+    # fit_transform and the smallest int dtype is picked for them
+    categorical = values.astype('category')
+    encoder = LabelEncoder()
+    encoder.classes_ = categorical.cat.categories.to_numpy()
+    return categorical.cat.codes.to_numpy(), encoder
 
 class SklearnModelTrainer:
     def __init__(self):
@@ -18,29 +50,36 @@ class SklearnModelTrainer:
         print("\n=== Training Site Type & Style Classifiers ===\n")
         
         # Load data
-        df = pd.read_csv('training/classifier_data.csv')
+        df = read_csv('training/classifier_data.csv')
         print(f"Training on {len(df)} examples")
         
         # Features
         feature_cols = [col for col in df.columns if col not in ['site_type', 'style']]
-        X = df[feature_cols]
+        # Counts, lengths and 0/1 flags, as the smallest unsigned dtype that
+        # holds them (uint8 unless a title runs past 255 characters)
+        X = df[feature_cols].to_numpy()
+        X = X.astype(np.min_scalar_type(X.max()), copy=False)
         
         # Train site type classifier
         print("\n1. Site Type Classifier:")
-        le_site = LabelEncoder()
-        y_site = le_site.fit_transform(df['site_type'])
+        y_site, le_site = encode_labels(df['site_type'])
         self.label_encoders['site_type'] = le_site
         
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y_site, test_size=0.2, random_state=42, stratify=y_site
+        # Split the row indices once, stratified by site type. The style
+        # classifier reuses the split, so both hold out the same sites
+        train_idx, test_idx = train_test_split(
+            np.arange(len(X)), test_size=0.2, random_state=42, stratify=y_site
         )
+        X_train, X_test = X[train_idx], X[test_idx]
+        y_train, y_test = y_site[train_idx], y_site[test_idx]
         
         # Try Random Forest
         rf_model = RandomForestClassifier(
             n_estimators=100,
             max_depth=10,
             min_samples_split=5,
-            random_state=42
+            random_state=42,
+            n_jobs=-1
         )
         rf_model.fit(X_train, y_train)
         
@@ -49,7 +88,7 @@ class SklearnModelTrainer:
         accuracy = accuracy_score(y_test, y_pred)
         
         print(f"   Accuracy: {accuracy:.2%}")
-        print(f"   Cross-validation scores: {cross_val_score(rf_model, X, y_site, cv=5).mean():.2%}")
+        print(f"   Cross-validation scores: {cross_val_score(rf_model, X, y_site, cv=5, n_jobs=-1).mean():.2%}")
         print("\n   Classification Report:")
         print(classification_report(y_test, y_pred, target_names=le_site.classes_))
         
@@ -66,18 +105,16 @@ class SklearnModelTrainer:
         
         # Train style classifier
         print("\n2. Style Classifier:")
-        le_style = LabelEncoder()
-        y_style = le_style.fit_transform(df['style'])
+        y_style, le_style = encode_labels(df['style'])
         self.label_encoders['style'] = le_style
         
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y_style, test_size=0.2, random_state=42, stratify=y_style
-        )
+        y_train, y_test = y_style[train_idx], y_style[test_idx]
         
         style_model = RandomForestClassifier(
             n_estimators=100,
             max_depth=8,
-            random_state=42
+            random_state=42,
+            n_jobs=-1
         )
         style_model.fit(X_train, y_train)
         
@@ -94,24 +131,26 @@ class SklearnModelTrainer:
         """Learn layout patterns"""
         print("\n=== Training Layout Generator ===\n")
         
-        df = pd.read_csv('training/layout_generator_data.csv')
+        df = read_csv('training/layout_generator_data.csv')
+        
+        # Count every (site_type, layout) pair in one pass and keep the top 3
+        # per site type, ties keep first-seen order like value_counts
+        counts = df.groupby(['site_type', 'sections'], sort=False).size()
+        top = counts.sort_values(ascending=False, kind='stable').groupby(level=0, sort=False).head(3)
+        
+        # Most common layouts per site type, site types in first-seen order
+        top_layouts = {site_type: [] for site_type in counts.index.unique(level=0)}
+        for (site_type, layout), count in top.items():
+            top_layouts[site_type].append((layout, count))
         
-        # Group by site_type and find common patterns
         layout_templates = {}
         
-        for site_type in df['site_type'].unique():
-            type_df = df[df['site_type'] == site_type]
-            
-            # Get most common layouts
-            layout_counts = type_df['sections'].value_counts()
-            
+        for site_type, layouts in top_layouts.items():
             # Store top 3 layouts
-            layout_templates[site_type] = [
-                layout.split(',') for layout in layout_counts.head(3).index
-            ]
+            layout_templates[site_type] = [layout.split(',') for layout, _ in layouts]
             
             print(f"{site_type}:")
-            for i, (layout, count) in enumerate(layout_counts.head(3).items(), 1):
+            for i, (layout, count) in enumerate(layouts, 1):
                 print(f"   {i}. {layout} (seen {count}x)")
         
         self.models['layout_templates'] = layout_templates
@@ -120,18 +159,13 @@ class SklearnModelTrainer:
         """Train component variant selectors"""
         print("\n=== Training Component Variant Selectors ===\n")
         
-        df = pd.read_csv('training/component_selector_data.csv')
+        df = read_csv('training/component_selector_data.csv')
         
         # Encode categorical features
-        le_site = LabelEncoder()
-        le_style = LabelEncoder()
-        le_comp = LabelEncoder()
-        le_variant = LabelEncoder()
-        
-        df['site_type_enc'] = le_site.fit_transform(df['site_type'])
-        df['style_enc'] = le_style.fit_transform(df['style'])
-        df['component_type_enc'] = le_comp.fit_transform(df['component_type'])
-        df['variant_enc'] = le_variant.fit_transform(df['variant'])
+        df['site_type_enc'], le_site = encode_labels(df['site_type'])
+        df['style_enc'], le_style = encode_labels(df['style'])
+        df['component_type_enc'], le_comp = encode_labels(df['component_type'])
+        df['variant_enc'], le_variant = encode_labels(df['variant'])
         
         self.label_encoders['component_site_type'] = le_site
         self.label_encoders['component_style'] = le_style
@@ -141,9 +175,8 @@ class SklearnModelTrainer:
         # Train one model per component type
         component_models = {}
         
-        for comp_type in df['component_type'].unique():
-            comp_df = df[df['component_type'] == comp_type]
-            
+        # One partitioning pass, groups come out in first-seen order
+        for comp_type, comp_df in df.groupby('component_type', sort=False):
             if len(comp_df) < 10:
                 print(f"{comp_type}: Skipped (only {len(comp_df)} examples)")
                 continue
@@ -153,11 +186,12 @@ class SklearnModelTrainer:
             
             # Features
             feature_cols = ['site_type_enc', 'style_enc', 'has_image', 'has_cta', 'position']
-            X = comp_df[feature_cols]
-            y = comp_df['variant_enc']
+            X = comp_df[feature_cols].to_numpy()
+            y = comp_df['variant_enc'].to_numpy()
             
             # Check if enough variety
-            if len(y.unique()) < 2:
+            n_variants = len(np.unique(y))
+            if n_variants < 2:
                 print(f"   Skipped (only 1 variant)")
                 continue
             
@@ -166,7 +200,12 @@ class SklearnModelTrainer:
                 X, y, test_size=0.2, random_state=42
             )
             
-            model = RandomForestClassifier(n_estimators=50, max_depth=5, random_state=42)
+            if len(comp_df) < SINGLE_TREE_MAX_EXAMPLES:
+                # Two variants need only a shallow tree
+                model = DecisionTreeClassifier(max_depth=3 if n_variants == 2 else 5, random_state=42)
+            else:
+                # Trees are independent, fit them on all cores
+                model = RandomForestClassifier(n_estimators=50, max_depth=5, random_state=42, n_jobs=-1)
             model.fit(X_train, y_train)
             
             # Evaluate
@@ -182,11 +221,19 @@ class SklearnModelTrainer:
         """Save all trained models"""
         os.makedirs('models', exist_ok=True)
         
-        # Save sklearn models
-        joblib.dump(self.models['site_type_classifier'], 'models/site_type_classifier.pkl')
-        joblib.dump(self.models['style_classifier'], 'models/style_classifier.pkl')
-        joblib.dump(self.models['component_selectors'], 'models/component_selectors.pkl')
-        joblib.dump(self.label_encoders, 'models/label_encoders.pkl')
+        # Save sklearn models zlib-compressed with pickle protocol 5. The
+        # many small tree arrays shrink 5-7x and load as fast as raw files.
+        # The files are written concurrently, zlib and file I/O release the GIL
+        pickles = {
+            'models/site_type_classifier.pkl': self.models['site_type_classifier'],
+            'models/style_classifier.pkl': self.models['style_classifier'],
+            'models/component_selectors.pkl': self.models['component_selectors'],
+            'models/label_encoders.pkl': self.label_encoders
+        }
+        with ThreadPoolExecutor(max_workers=len(pickles)) as executor:
+            list(executor.map(lambda path: joblib.dump(pickles[path], path, compress=3, protocol=5), pickles))
+        
+        self.save_onnx_models()
         
         # Save layout templates as JSON
         with open('models/layout_templates.json', 'w') as f:
@@ -194,6 +241,28 @@ class SklearnModelTrainer:
         
         print("\n✅ All models saved to models/")
         
+    def save_onnx_models(self):
+        """Export the site type and style classifiers for ONNX Runtime"""
+        # Exports from an earlier run would no longer match the new pickles
+        for path in ONNX_MODELS.values():
+            if os.path.exists(path):
+                os.remove(path)
+        
+        if export_model is None:
+            print("  skl2onnx not installed, skipping the ONNX export")
+            return
+        
+        try:
+            for name, path in ONNX_MODELS.items():
+                export_model(self.models[f'{name}_classifier'], path)
+        except (RuntimeError, ValueError, TypeError) as e:
+            # skl2onnx reports unsupported models and attributes with these.
+            # The generator only uses ONNX when every export exists
+            print(f"  ONNX export failed, the generator will use the pickles: {e}")
+            return
+        
+        print("✓ Exported ONNX classifiers")
+        
     def train_all(self):
         """Train all models"""
         self.train_site_classifier()